@@ -19,6 +19,7 @@ from hunknote.llm.base import (
     RawLLMResult,
     MissingAPIKeyError,
 )
+from hunknote.llm.litellm_provider import LiteLLMProvider
 
 # Load environment variables from .env file
 load_dotenv()
@@ -44,8 +45,6 @@ def get_provider(
     Raises:
         ValueError: If the provider is not supported.
     """
-    from hunknote.llm.litellm_provider import LiteLLMProvider
-
     # Read config values at call time (not import time) so that
     # load_config() updates are visible even if this module was
     # imported before load_config() ran.
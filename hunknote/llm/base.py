@@ -41,20 +41,51 @@ from hunknote.llm.parsing import (
 )
 
 
-@dataclass
+def _split_template(template: str) -> tuple[str, str]:
+    """Split a user prompt template around its {context_bundle} placeholder.
+
+    Both halves are unescaped ("{{" -> "{") so that prefix + context + suffix
+    equals template.format(context_bundle=context) without re-parsing the
+    template on every call.
+
+    Args:
+        template: A prompt template with a single {context_bundle} field.
+
+    Returns:
+        Tuple of (prefix, suffix) strings.
+    """
+    prefix, _, suffix = template.partition("{context_bundle}")
+    return prefix.format(), suffix.format()
+
+
+# Style name -> pre-split user prompt template. Unknown styles fall back to default.
+_STYLE_TEMPLATE_PARTS: dict[str, tuple[str, str]] = {
+    "default": _split_template(USER_PROMPT_TEMPLATE_DEFAULT),
+    "blueprint": _split_template(USER_PROMPT_TEMPLATE_BLUEPRINT),
+    "conventional": _split_template(USER_PROMPT_TEMPLATE_CONVENTIONAL),
+    "ticket": _split_template(USER_PROMPT_TEMPLATE_TICKET),
+    "kernel": _split_template(USER_PROMPT_TEMPLATE_KERNEL),
+}
+
+
+@dataclass(slots=True, frozen=True)
 class LLMResult:
-    """Result from an LLM generation call, including token usage."""
+    """Result from an LLM generation call, including token usage.
+
+    Fields are ordered with the frequently read counters first and the
+    bulky raw response last. Instances are immutable.
+    """
 
-    commit_json: ExtendedCommitJSON  # Changed from CommitMessageJSON to ExtendedCommitJSON
     model: str
     input_tokens: int
     output_tokens: int
-    raw_response: str = ""  # Raw LLM response for debugging
+    commit_json: ExtendedCommitJSON  # Changed from CommitMessageJSON to ExtendedCommitJSON
     # Character counts for debugging
     input_chars: int = 0  # Characters in context bundle
     prompt_chars: int = 0  # Characters in full prompt (system + user)
     output_chars: int = 0  # Characters in LLM response
     thinking_tokens: int = 0  # Internal reasoning tokens (thinking models)
+    raw_response: str = ""  # Raw LLM response for debugging
 
 
 @dataclass
@@ -177,7 +208,8 @@ class BaseLLMProvider(ABC):
         Returns:
             The formatted user prompt.
         """
-        return USER_PROMPT_TEMPLATE_DEFAULT.format(context_bundle=context_bundle)
+        prefix, suffix = _STYLE_TEMPLATE_PARTS["default"]
+        return "".join((prefix, context_bundle, suffix))
 
     def build_user_prompt_styled(self, context_bundle: str) -> str:
         """Build the extended user prompt for style profiles (conventional as default).
@@ -188,7 +220,8 @@ class BaseLLMProvider(ABC):
         Returns:
             The formatted user prompt with extended schema instructions.
         """
-        return USER_PROMPT_TEMPLATE_CONVENTIONAL.format(context_bundle=context_bundle)
+        prefix, suffix = _STYLE_TEMPLATE_PARTS["conventional"]
+        return "".join((prefix, context_bundle, suffix))
 
     def build_user_prompt_for_style(self, context_bundle: str, style: str) -> str:
         """Build the user prompt for a specific style profile.
@@ -200,15 +233,13 @@ class BaseLLMProvider(ABC):
         Returns:
             The formatted user prompt for the specified style.
         """
-        style_lower = style.lower() if style else "default"
-
-        if style_lower == "blueprint":
-            return USER_PROMPT_TEMPLATE_BLUEPRINT.format(context_bundle=context_bundle)
-        elif style_lower == "conventional":
-            return USER_PROMPT_TEMPLATE_CONVENTIONAL.format(context_bundle=context_bundle)
-        elif style_lower == "ticket":
-            return USER_PROMPT_TEMPLATE_TICKET.format(context_bundle=context_bundle)
-        elif style_lower == "kernel":
-            return USER_PROMPT_TEMPLATE_KERNEL.format(context_bundle=context_bundle)
-        else:  # default
-            return USER_PROMPT_TEMPLATE_DEFAULT.format(context_bundle=context_bundle)
+        if not style:
+            parts = _STYLE_TEMPLATE_PARTS["default"]
+        else:
+            # Fast path: canonical lowercase names skip the str.lower() allocation
+            parts = _STYLE_TEMPLATE_PARTS.get(style)
+            if parts is None:
+                parts = _STYLE_TEMPLATE_PARTS.get(style.lower(), _STYLE_TEMPLATE_PARTS["default"])
+
+        prefix, suffix = parts
+        return "".join((prefix, context_bundle, suffix))
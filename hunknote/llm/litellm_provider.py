@@ -16,8 +16,6 @@ LiteLLM model name format per provider:
 
 import os
 
-import litellm
-
 import hunknote.config as _config
 from hunknote.config import (
     API_KEY_ENV_VARS,
@@ -34,9 +32,6 @@ from hunknote.llm.base import (
     validate_commit_json,
 )
 
-# Suppress litellm's noisy logging by default
-litellm.suppress_debug_info = True
-
 # ============================================================
 # LiteLLM model prefix mapping
 # ============================================================
@@ -88,6 +83,24 @@ _THINKING_MODEL_PATTERNS = [
 _THINKING_TOKEN_MULTIPLIER = 3
 
 
+def _litellm():
+    """Return the litellm module, importing it on first use.
+
+    litellm takes seconds to import (it loads its model cost map at import
+    time), so it is only pulled in when an LLM call is actually made.
+    Constructing a provider, resolving API keys or computing token budgets
+    never pays that cost.
+
+    Returns:
+        The litellm module.
+    """
+    import litellm
+
+    # Suppress litellm's noisy logging by default
+    litellm.suppress_debug_info = True
+    return litellm
+
+
 def _build_litellm_model_name(provider: LLMProvider, model: str) -> str:
     """Build the litellm model identifier from provider + model name.
 
@@ -239,7 +252,7 @@ class LiteLLMProvider(BaseLLMProvider):
         user_prompt = self.build_user_prompt_for_style(context_bundle, self.style)
 
         try:
-            response = litellm.completion(
+            response = _litellm().completion(
                 model=self._litellm_model,
                 messages=[
                     {"role": "system", "content": SYSTEM_PROMPT},
@@ -315,7 +328,7 @@ class LiteLLMProvider(BaseLLMProvider):
         api_key = self._inject_api_key_for_litellm()
 
         try:
-            response = litellm.completion(
+            response = _litellm().completion(
                 model=self._litellm_model,
                 messages=[
                     {"role": "system", "content": system_prompt},
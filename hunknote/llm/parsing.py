@@ -7,14 +7,37 @@ Contains functions for parsing and validating LLM responses:
 """
 
 import json
+import re
+
+from pydantic import TypeAdapter
 
 from hunknote.styles import ExtendedCommitJSON
 from hunknote.llm.exceptions import JSONParseError
 
+# Markdown code fence wrapping the whole response: ```json ... ``` (closing fence optional).
+# Surrounding whitespace is matched here so the response never needs a strip() copy.
+_FENCE_RE = re.compile(r"\s*```[^\n]*\n(.*?)(?:\n\s*```)?\s*$", re.DOTALL)
+
+# Shared decoder; raw_decode parses from an offset without slicing the string
+_DECODER = json.JSONDecoder()
+
+# Style-specific field names moved onto the common schema (kernel: subsystem -> scope)
+_RENAMED_FIELDS: tuple[tuple[str, str], ...] = (("subsystem", "scope"),)
+
+# Fields copied onto each other when only one is present (subject <-> title)
+_MIRRORED_FIELDS: tuple[tuple[str, str], ...] = (("subject", "title"), ("title", "subject"))
+
+# Schema resolved once at import; validate_python runs entirely in pydantic-core
+_COMMIT_ADAPTER = TypeAdapter(ExtendedCommitJSON)
+
 
 def parse_json_response(raw_response: str) -> dict:
     """Parse the LLM response as JSON.
 
+    Markdown code fences around the response are removed. If the remaining
+    text contains braces, the span from the first "{" to the last "}" is
+    decoded in place and must form a single JSON value.
+
     Args:
         raw_response: The raw text response from the LLM.
 
@@ -24,28 +47,34 @@ def parse_json_response(raw_response: str) -> dict:
     Raises:
         JSONParseError: If parsing fails.
     """
-    # Clean up the response - remove any markdown fences if present
-    cleaned = raw_response.strip()
-
-    # Remove markdown code fences if the model included them despite instructions
-    if cleaned.startswith("```"):
-        lines = cleaned.split("\n")
-        # Remove first line (```json or ```)
-        lines = lines[1:]
-        # Remove last line if it's ```
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        cleaned = "\n".join(lines)
+    # Reject empty/whitespace-only responses before any regex or decoder work
+    if not raw_response or raw_response.isspace():
+        raise JSONParseError(
+            f"Failed to parse LLM response as JSON.\n"
+            f"Error: empty response\n"
+            f"Raw response:\n{raw_response}"
+        )
+
+    # Remove markdown code fences if the model included them despite instructions.
+    # Leading/trailing whitespace is skipped by the brace search and json itself.
+    cleaned = raw_response
+    fence_match = _FENCE_RE.match(cleaned)
+    if fence_match:
+        cleaned = fence_match.group(1)
 
     # Try to extract JSON object if there's extra content
     # Find the first { and last }
     first_brace = cleaned.find("{")
     last_brace = cleaned.rfind("}")
 
-    if first_brace != -1 and last_brace != -1 and last_brace > first_brace:
-        cleaned = cleaned[first_brace:last_brace + 1]
-
     try:
+        if first_brace != -1 and last_brace > first_brace:
+            # Decode in place from the first brace; the object must close at the
+            # last brace, otherwise the span holds more than one JSON value
+            parsed, end = _DECODER.raw_decode(cleaned, first_brace)
+            if end != last_brace + 1:
+                raise json.JSONDecodeError("Extra data", cleaned, end)
+            return parsed
         return json.loads(cleaned)
     except json.JSONDecodeError as e:
         raise JSONParseError(
@@ -74,7 +103,7 @@ def validate_commit_json(parsed: dict, raw_response: str) -> ExtendedCommitJSON:
     try:
         # Normalize the parsed data to handle different style formats
         normalized = _normalize_commit_json(parsed)
-        return ExtendedCommitJSON(**normalized)
+        return _COMMIT_ADAPTER.validate_python(normalized)
     except Exception as e:
         raise JSONParseError(
             f"LLM response does not match expected schema.\n"
@@ -102,29 +131,20 @@ def _normalize_commit_json(parsed: dict) -> dict:
     result = dict(parsed)  # Copy to avoid modifying original
 
     # Handle kernel style: subsystem -> scope
-    if "subsystem" in result and "scope" not in result:
-        result["scope"] = result.pop("subsystem")
+    for src, dst in _RENAMED_FIELDS:
+        if src in result and dst not in result:
+            result[dst] = result.pop(src)
 
     # Ensure we have either title or subject
-    # If only subject is provided, also set title for backward compatibility
-    if "subject" in result and "title" not in result:
-        result["title"] = result["subject"]
-    elif "title" in result and "subject" not in result:
-        result["subject"] = result["title"]
+    # If only one is provided, mirror it onto the other for backward compatibility
+    for src, dst in _MIRRORED_FIELDS:
+        if src in result and dst not in result:
+            result[dst] = result[src]
 
     # Ensure body_bullets exists (may be empty for blueprint style)
     if "body_bullets" not in result:
         result["body_bullets"] = []
 
-    # Handle sections for blueprint style - convert dicts to BlueprintSection
-    if "sections" in result:
-        sections = []
-        for section in result["sections"]:
-            if isinstance(section, dict):
-                sections.append(section)
-            else:
-                sections.append(section)
-        result["sections"] = sections
-
+    # Blueprint sections are left as-is; ExtendedCommitJSON converts dicts
+    # to BlueprintSection during validation
     return result
-
@@ -8,10 +8,14 @@ Contains functions for:
 from hunknote.styles.constants import (
     BLUEPRINT_SECTION_TITLES,
     CONVENTIONAL_TYPES,
+    DEFAULT_TICKET_KEY_REGEX,
     StyleProfile,
 )
 from hunknote.styles.models import StyleConfig
 
+# Profile value -> StyleProfile, so unknown names are a dict miss, not an exception
+_PROFILE_BY_NAME = {p.value: p for p in StyleProfile}
+
 
 def load_style_config_from_dict(config_dict: dict) -> StyleConfig:
     """Load StyleConfig from a configuration dictionary.
@@ -26,14 +30,16 @@ def load_style_config_from_dict(config_dict: dict) -> StyleConfig:
 
     # Get profile
     profile_str = style_section.get("profile", "default")
-    try:
-        profile = StyleProfile(profile_str)
-    except ValueError:
+    if isinstance(profile_str, StyleProfile):
+        profile = profile_str
+    elif isinstance(profile_str, str):
+        profile = _PROFILE_BY_NAME.get(profile_str, StyleProfile.DEFAULT)
+    else:
         profile = StyleProfile.DEFAULT
 
     # Get conventional config
     conv_section = style_section.get("conventional", {})
-    conventional_types = conv_section.get("types", CONVENTIONAL_TYPES.copy())
+    conventional_types = conv_section.get("types", list(CONVENTIONAL_TYPES))
 
     # Get ticket config
     ticket_section = style_section.get("ticket", {})
@@ -51,10 +57,10 @@ def load_style_config_from_dict(config_dict: dict) -> StyleConfig:
         wrap_width=style_section.get("wrap_width", 72),
         conventional_types=conventional_types,
         breaking_footer=conv_section.get("breaking_footer", True),
-        ticket_key_regex=ticket_section.get("key_regex", r"([A-Z][A-Z0-9]+-\d+)"),
+        ticket_key_regex=ticket_section.get("key_regex", DEFAULT_TICKET_KEY_REGEX),
         ticket_placement=ticket_section.get("placement", "prefix"),
         subsystem_from_scope=kernel_section.get("subsystem_from_scope", True),
-        blueprint_section_titles=blueprint_section.get("section_titles", BLUEPRINT_SECTION_TITLES.copy()),
+        blueprint_section_titles=blueprint_section.get("section_titles", list(BLUEPRINT_SECTION_TITLES)),
     )
 
 
@@ -2,11 +2,14 @@
 
 Contains:
 - CONVENTIONAL_TYPES: Valid conventional commit types
+- FALLBACK_COMMIT_TYPE: Type used when a commit's type is not recognised
 - BLUEPRINT_SECTION_TITLES: Allowed section titles for blueprint style
+- DEFAULT_TICKET_KEY_REGEX: Default pattern for ticket keys (e.g. PROJ-123)
 - PROFILE_DESCRIPTIONS: Descriptions for each style profile (for help/display)
 """
 
 from enum import Enum
+from types import MappingProxyType
 
 
 class StyleProfile(Enum):
@@ -19,8 +22,8 @@ class StyleProfile(Enum):
     KERNEL = "kernel"
 
 
-# Valid conventional commit types
-CONVENTIONAL_TYPES = [
+# Valid conventional commit types (immutable; copy with list() to customize)
+CONVENTIONAL_TYPES = (
     "feat",
     "fix",
     "docs",
@@ -33,10 +36,13 @@ CONVENTIONAL_TYPES = [
     "style",
     "revert",
     "merge",
-]
+)
 
-# Allowed section titles for blueprint style (in preferred order)
-BLUEPRINT_SECTION_TITLES = [
+# Type used when the LLM returns a type outside the configured list
+FALLBACK_COMMIT_TYPE = "chore"
+
+# Allowed section titles for blueprint style (in preferred order, immutable)
+BLUEPRINT_SECTION_TITLES = (
     "Changes",
     "Implementation",
     "Testing",
@@ -46,11 +52,14 @@ BLUEPRINT_SECTION_TITLES = [
     "Security",
     "Config",
     "API",
-]
+)
+
+# Default regex for ticket keys in branch names (group 1 is the key)
+DEFAULT_TICKET_KEY_REGEX = r"([A-Z][A-Z0-9]+-\d+)"
 
 
-# Profile descriptions for help/display (ordered for style list display)
-PROFILE_DESCRIPTIONS = {
+# Profile descriptions for help/display (ordered for style list display, read-only)
+PROFILE_DESCRIPTIONS = MappingProxyType({
     StyleProfile.DEFAULT: {
         "name": "default",
         "description": "Standard Hunknote format with title and bullet points",
@@ -81,5 +90,4 @@ PROFILE_DESCRIPTIONS = {
         "format": "<subsystem>: <subject>\n\n- <bullet> (optional)",
         "example": "auth: Add user authentication\n\n- Implement login endpoint",
     },
-}
-
+})
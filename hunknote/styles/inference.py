@@ -8,8 +8,59 @@ Contains functions for:
 import re
 from typing import Optional
 
+from hunknote.styles.constants import DEFAULT_TICKET_KEY_REGEX
 
-def extract_ticket_from_branch(branch: str, pattern: str = r"([A-Z][A-Z0-9]+-\d+)") -> Optional[str]:
+# Compiled once, with search pre-bound; custom patterns go through re's own
+# compile cache
+_DEFAULT_TICKET_RE = re.compile(DEFAULT_TICKET_KEY_REGEX)
+_DEFAULT_TICKET_SEARCH = _DEFAULT_TICKET_RE.search
+
+# infer_commit_type patterns, built once. Matching is by substring (suffix for
+# doc extensions), so an entry contained in another makes the longer one redundant.
+_DOC_EXTENSIONS = (".md", ".rst", ".txt", ".adoc")
+_DOC_DIRS = ("doc",)  # also covers "docs" and "documentation"
+_TEST_PATTERNS = ("test_", "_test.", ".test.", "tests/", "test/", "spec/", "__tests__/")
+_CI_PATTERNS = (".github/workflows", ".gitlab-ci", "Jenkinsfile", ".circleci", ".travis")
+_BUILD_FILES = (
+    "package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml",
+    "pyproject.toml", "poetry.lock", "setup.py", "setup.cfg", "requirements.txt",
+    "Makefile", "CMakeLists.txt", "Cargo.toml", "Cargo.lock",
+    "go.mod", "go.sum", "Gemfile",
+    "Dockerfile", "docker-compose",
+)
+
+
+def _is_docs(path: str, lowered: str) -> bool:
+    """Doc extension, or a doc directory anywhere in the path."""
+    return path.endswith(_DOC_EXTENSIONS) or any(d in lowered for d in _DOC_DIRS)
+
+
+def _is_test(path: str, lowered: str) -> bool:
+    """Test file or test directory."""
+    return any(p in lowered for p in _TEST_PATTERNS)
+
+
+def _is_ci(path: str, lowered: str) -> bool:
+    """CI configuration."""
+    return any(p in path for p in _CI_PATTERNS)
+
+
+def _is_build(path: str, lowered: str) -> bool:
+    """Build or dependency manifest."""
+    return any(bf in path for bf in _BUILD_FILES)
+
+
+# (type, matcher) in priority order; CI comes before build since CI files
+# often match build patterns too
+_TYPE_MATCHERS = (
+    ("docs", _is_docs),
+    ("test", _is_test),
+    ("ci", _is_ci),
+    ("build", _is_build),
+)
+
+
+def extract_ticket_from_branch(branch: str, pattern: str = DEFAULT_TICKET_KEY_REGEX) -> Optional[str]:
     """Extract ticket key from branch name.
 
     Args:
@@ -19,7 +70,13 @@ def extract_ticket_from_branch(branch: str, pattern: str = r"([A-Z][A-Z0-9]+-\d+
     Returns:
         The extracted ticket key or None.
     """
-    match = re.search(pattern, branch)
+    if pattern == DEFAULT_TICKET_KEY_REGEX:
+        # Default keys start with [A-Z]; an all-lowercase branch cannot hold one
+        if branch == branch.lower():
+            return None
+        match = _DEFAULT_TICKET_SEARCH(branch)
+    else:
+        match = re.compile(pattern).search(branch)
     if match:
         return match.group(1)
     return None
@@ -37,50 +94,19 @@ def infer_commit_type(staged_files: list[str]) -> Optional[str]:
     if not staged_files:
         return None
 
-    # Check for docs-only changes
-    doc_extensions = {".md", ".rst", ".txt", ".adoc"}
-    doc_dirs = {"docs", "doc", "documentation"}
-
-    all_docs = all(
-        any(f.endswith(ext) for ext in doc_extensions) or
-        any(d in f.lower() for d in doc_dirs)
-        for f in staged_files
-    )
-    if all_docs:
-        return "docs"
-
-    # Check for test-only changes
-    test_patterns = {"test_", "_test.", ".test.", "tests/", "test/", "spec/", "__tests__/"}
-    all_tests = all(
-        any(p in f.lower() for p in test_patterns)
-        for f in staged_files
-    )
-    if all_tests:
-        return "test"
-
-    # Check for CI changes (BEFORE build, since CI files often match build patterns)
-    ci_patterns = {".github/workflows/", ".github/workflows", ".gitlab-ci", "Jenkinsfile", ".circleci/", ".travis", ".circleci"}
-    all_ci = all(
-        any(p in f for p in ci_patterns)
-        for f in staged_files
-    )
-    if all_ci:
-        return "ci"
-
-    # Check for config/build changes (excluding CI files)
-    build_files = {
-        "package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml",
-        "pyproject.toml", "poetry.lock", "setup.py", "setup.cfg", "requirements.txt",
-        "Makefile", "CMakeLists.txt", "Cargo.toml", "Cargo.lock",
-        "go.mod", "go.sum", "Gemfile", "Gemfile.lock",
-        "Dockerfile", "docker-compose",
-    }
-    all_build = all(
-        any(bf in f for bf in build_files)
-        for f in staged_files
-    )
-    if all_build:
-        return "build"
-
-    return None
-
+    # One-file commits are common: take the first matching type directly
+    if len(staged_files) == 1:
+        path = staged_files[0]
+        lowered = path.lower()
+        return next((t for t, matches in _TYPE_MATCHERS if matches(path, lowered)), None)
+
+    # Types every file seen so far still matches, in priority order. Stop as
+    # soon as a file rules out the last one (mixed commits are the common case).
+    candidates = _TYPE_MATCHERS
+    for f in staged_files:
+        lowered = f.lower()
+        candidates = tuple((t, m) for t, m in candidates if m(f, lowered))
+        if not candidates:
+            return None
+
+    return candidates[0][0]
@@ -9,18 +9,22 @@ Contains:
 from dataclasses import dataclass, field
 from typing import Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from hunknote.styles.constants import (
     BLUEPRINT_SECTION_TITLES,
     CONVENTIONAL_TYPES,
+    DEFAULT_TICKET_KEY_REGEX,
     StyleProfile,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class StyleConfig:
-    """Configuration for commit style rendering."""
+    """Configuration for commit style rendering.
+
+    Instances are slotted; only the fields below can be set.
+    """
 
     profile: StyleProfile = StyleProfile.DEFAULT
     include_body: bool = True
@@ -29,11 +33,11 @@ class StyleConfig:
 
     # Conventional commits config
     conventional_types: list[str] = field(
-        default_factory=lambda: CONVENTIONAL_TYPES.copy())
+        default_factory=lambda: list(CONVENTIONAL_TYPES))
     breaking_footer: bool = True
 
     # Ticket config
-    ticket_key_regex: str = r"([A-Z][A-Z0-9]+-\d+)"
+    ticket_key_regex: str = DEFAULT_TICKET_KEY_REGEX
     ticket_placement: str = "prefix"  # prefix | suffix
 
     # Kernel config
@@ -41,17 +45,22 @@ class StyleConfig:
 
     # Blueprint config
     blueprint_section_titles: list[str] = field(
-        default_factory=lambda: BLUEPRINT_SECTION_TITLES.copy())
+        default_factory=lambda: list(BLUEPRINT_SECTION_TITLES))
 
 
 class BlueprintSection(BaseModel):
     """A section in a blueprint-style commit message.
 
+    Sections are frozen: they are shared between the parsed commit data
+    and every render, so fields cannot be reassigned after validation.
+
     Attributes:
         title: Section title (e.g., "Changes", "Implementation").
         bullets: List of bullet points for this section.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     bullets: list[str] = []
 
@@ -207,11 +216,7 @@ class ExtendedCommitJSON(BaseModel):
         if allowed_titles is None:
             return self.sections
 
-        # Filter and order by allowed_titles
+        # Filter and order by allowed_titles (one dict build, one pass)
         title_to_section = {s.title: s for s in self.sections}
-        result = []
-        for title in allowed_titles:
-            if title in title_to_section:
-                result.append(title_to_section[title])
-        return result
+        return [title_to_section[title] for title in allowed_titles if title in title_to_section]
 
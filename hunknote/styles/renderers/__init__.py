@@ -3,7 +3,7 @@
 Re-exports all renderer functions and the main render_commit_message_styled function.
 """
 
-from typing import Optional
+from typing import Callable, Optional
 
 from hunknote.styles.constants import StyleProfile
 from hunknote.styles.models import ExtendedCommitJSON, StyleConfig
@@ -14,6 +14,26 @@ from hunknote.styles.renderers.default import render_default
 from hunknote.styles.renderers.kernel import render_kernel
 from hunknote.styles.renderers.ticket import render_ticket
 
+# Profile -> renderer adapter taking
+# (data, config, override_scope, override_ticket, no_scope).
+_RENDERERS: dict[StyleProfile, Callable[..., str]] = {
+    StyleProfile.BLUEPRINT: lambda data, config, scope, ticket, no_scope: (
+        render_blueprint(data, config, scope, no_scope)
+    ),
+    StyleProfile.CONVENTIONAL: lambda data, config, scope, ticket, no_scope: (
+        render_conventional(data, config, scope, no_scope)
+    ),
+    StyleProfile.TICKET: lambda data, config, scope, ticket, no_scope: (
+        render_ticket(data, config, ticket, scope)
+    ),
+    StyleProfile.KERNEL: lambda data, config, scope, ticket, no_scope: (
+        render_kernel(data, config, scope)
+    ),
+    StyleProfile.DEFAULT: lambda data, config, scope, ticket, no_scope: (
+        render_default(data, config)
+    ),
+}
+
 
 def render_commit_message_styled(
     data: ExtendedCommitJSON,
@@ -37,17 +57,8 @@ def render_commit_message_styled(
         Formatted commit message string.
     """
     profile = override_style or config.profile
-
-    if profile == StyleProfile.BLUEPRINT:
-        return render_blueprint(data, config, override_scope, no_scope)
-    elif profile == StyleProfile.CONVENTIONAL:
-        return render_conventional(data, config, override_scope, no_scope)
-    elif profile == StyleProfile.TICKET:
-        return render_ticket(data, config, override_ticket, override_scope)
-    elif profile == StyleProfile.KERNEL:
-        return render_kernel(data, config, override_scope)
-    else:  # DEFAULT
-        return render_default(data, config)
+    renderer = _RENDERERS.get(profile, _RENDERERS[StyleProfile.DEFAULT])
+    return renderer(data, config, override_scope, override_ticket, no_scope)
 
 
 __all__ = [
@@ -4,11 +4,29 @@ Contains common functions used across all style renderers:
 - wrap_text: Wrap text to specified width
 - sanitize_subject: Sanitize and truncate subject lines
 - strip_type_prefix: Remove conventional commit type prefix from subject
+- resolve_commit_type: Pick the commit type, falling back to "chore"
 """
 
 import textwrap
+from functools import lru_cache
 
-from hunknote.styles.constants import CONVENTIONAL_TYPES
+from hunknote.styles.constants import CONVENTIONAL_TYPES, FALLBACK_COMMIT_TYPE
+
+
+@lru_cache(maxsize=32)
+def _get_wrapper(width: int, initial_indent: str, subsequent_indent: str) -> textwrap.TextWrapper:
+    """Return a shared TextWrapper for one width/indent combination.
+
+    Renderers only use a handful of combinations, so reusing wrappers saves
+    building a new one for every bullet.
+    """
+    return textwrap.TextWrapper(
+        width=width,
+        initial_indent=initial_indent,
+        subsequent_indent=subsequent_indent,
+        break_long_words=False,
+        break_on_hyphens=False,
+    )
 
 
 def wrap_text(text: str, width: int = 72, initial_indent: str = "", subsequent_indent: str = "") -> str:
@@ -23,14 +41,7 @@ def wrap_text(text: str, width: int = 72, initial_indent: str = "", subsequent_i
     Returns:
         Wrapped text.
     """
-    return textwrap.fill(
-        text,
-        width=width,
-        initial_indent=initial_indent,
-        subsequent_indent=subsequent_indent,
-        break_long_words=False,
-        break_on_hyphens=False,
-    )
+    return _get_wrapper(width, initial_indent, subsequent_indent).fill(text)
 
 
 def strip_type_prefix(subject: str, types: list[str] | None = None) -> str:
@@ -53,24 +64,41 @@ def strip_type_prefix(subject: str, types: list[str] | None = None) -> str:
 
     subject = subject.strip()
 
-    # Pattern: type: subject or type(scope): subject
-    for commit_type in types:
-        # Check for "type: " prefix
-        prefix = f"{commit_type}: "
-        if subject.lower().startswith(prefix.lower()):
-            return subject[len(prefix):].strip()
-
-        # Check for "type(scope): " prefix
-        if subject.lower().startswith(f"{commit_type}("):
-            # Find the closing ) and :
-            paren_end = subject.find(")")
-            if paren_end != -1 and len(subject) > paren_end + 1:
-                if subject[paren_end + 1] == ":":
-                    return subject[paren_end + 2:].strip()
+    # Both prefix forms need a colon; most subjects have none
+    if ":" not in subject:
+        return subject
+
+    lowered = subject.lower()
+
+    # Pattern: "type: subject" -- the type is everything before the first ": "
+    head, sep, _ = lowered.partition(": ")
+    if sep and any(head == commit_type.lower() for commit_type in types):
+        return subject[len(head) + 2:].strip()
+
+    # Pattern: "type(scope): subject"
+    head, sep, _ = lowered.partition("(")
+    if sep and head in types:
+        # Find the closing ) and :
+        paren_end = subject.find(")")
+        if paren_end != -1 and subject[paren_end + 1:paren_end + 2] == ":":
+            return subject[paren_end + 2:].strip()
 
     return subject
 
 
+def resolve_commit_type(commit_type: str, types: list[str]) -> str:
+    """Return commit_type if it is one of types, otherwise "chore".
+
+    Args:
+        commit_type: The requested commit type.
+        types: List of valid types.
+
+    Returns:
+        A valid commit type.
+    """
+    return commit_type if commit_type in types else FALLBACK_COMMIT_TYPE
+
+
 def sanitize_subject(subject: str, max_length: int = 72) -> str:
     """Sanitize and truncate the subject line.
 
@@ -13,7 +13,12 @@ Format:
 from typing import Optional
 
 from hunknote.styles.models import ExtendedCommitJSON, StyleConfig
-from hunknote.styles.renderers.base import sanitize_subject, strip_type_prefix, wrap_text
+from hunknote.styles.renderers.base import (
+    resolve_commit_type,
+    sanitize_subject,
+    strip_type_prefix,
+    wrap_text,
+)
 
 
 def render_blueprint(
@@ -42,11 +47,7 @@ def render_blueprint(
     Returns:
         Formatted commit message.
     """
-    commit_type = data.get_type("feat")
-
-    # Validate type
-    if commit_type not in config.conventional_types:
-        commit_type = "chore"
+    commit_type = resolve_commit_type(data.get_type("feat"), config.conventional_types)
 
     # Determine scope
     scope = None
@@ -83,34 +84,34 @@ def render_blueprint(
 
     # Add sections
     sections = data.get_sections(config.blueprint_section_titles)
-    if sections:
-        for section in sections:
-            if section.bullets:
-                parts.append("")  # Blank line before section
-                parts.append(f"{section.title}:")
-                for bullet in section.bullets:
-                    wrapped = wrap_text(
-                        bullet,
-                        width=config.wrap_width,
-                        initial_indent="- ",
-                        subsequent_indent="  ",
-                    )
-                    parts.append(wrapped)
+    for section in sections:
+        if section.bullets:
+            # Blank line before section
+            parts.extend(("", f"{section.title}:"))
+            parts.extend(_wrap_bullets(section.bullets, config.wrap_width))
 
     # Fallback: if no sections but has body_bullets, render as "Changes" section
     if not sections and config.include_body:
         bullets = data.get_bullets(config.max_bullets)
         if bullets:
-            parts.append("")
-            parts.append("Changes:")
-            for bullet in bullets:
-                wrapped = wrap_text(
-                    bullet,
-                    width=config.wrap_width,
-                    initial_indent="- ",
-                    subsequent_indent="  ",
-                )
-                parts.append(wrapped)
+            parts.extend(("", "Changes:"))
+            parts.extend(_wrap_bullets(bullets, config.wrap_width))
 
     return "\n".join(parts)
 
+
+def _wrap_bullets(bullets: list[str], width: int) -> list[str]:
+    """Wrap each bullet as a "- " item with a two-space hanging indent.
+
+    Args:
+        bullets: Bullet texts.
+        width: Maximum line width.
+
+    Returns:
+        One wrapped string per bullet.
+    """
+    return [
+        wrap_text(bullet, width=width, initial_indent="- ", subsequent_indent="  ")
+        for bullet in bullets
+    ]
+
@@ -13,7 +13,12 @@ Format:
 from typing import Optional
 
 from hunknote.styles.models import ExtendedCommitJSON, StyleConfig
-from hunknote.styles.renderers.base import sanitize_subject, strip_type_prefix, wrap_text
+from hunknote.styles.renderers.base import (
+    resolve_commit_type,
+    sanitize_subject,
+    strip_type_prefix,
+    wrap_text,
+)
 
 
 def render_conventional(
@@ -42,12 +47,7 @@ def render_conventional(
     Returns:
         Formatted commit message.
     """
-    commit_type = data.get_type("feat")
-
-    # Validate type
-    if commit_type not in config.conventional_types:
-        # Fall back to closest match or 'chore'
-        commit_type = "chore"
+    commit_type = resolve_commit_type(data.get_type("feat"), config.conventional_types)
 
     # Determine scope
     scope = None
@@ -74,6 +74,11 @@ def render_conventional(
     else:
         header = f"{commit_type}: {subject}"
 
+    # Header-only commits need no body or footer assembly
+    has_breaking_footer = data.breaking_change and config.breaking_footer
+    if not (data.body_bullets or data.footers or data.ticket or has_breaking_footer):
+        return header
+
     parts = [header]
 
     # Add body bullets
@@ -95,7 +100,7 @@ def render_conventional(
     # Add footers
     footers_to_add = []
 
-    if data.breaking_change and config.breaking_footer:
+    if has_breaking_footer:
         footers_to_add.append("BREAKING CHANGE: This commit introduces breaking changes")
 
     if data.footers:
@@ -1,12 +1,19 @@
 """Tests for the unified LiteLLM provider."""
 
 import os
+import re
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from hunknote.config import LLMProvider
-from hunknote.llm.base import MissingAPIKeyError, LLMResult, RawLLMResult
+from hunknote.config import API_KEY_ENV_VARS, LLMProvider
+from hunknote.llm import generate_commit_json
+from hunknote.llm.base import (
+    LLMError,
+    LLMResult,
+    MissingAPIKeyError,
+    RawLLMResult,
+)
 from hunknote.llm.litellm_provider import (
     LiteLLMProvider,
     _build_litellm_model_name,
@@ -14,6 +21,57 @@ from hunknote.llm.litellm_provider import (
     _LITELLM_PREFIX,
     _LITELLM_API_KEY_ENV,
 )
+from hunknote.styles import ExtendedCommitJSON
+
+
+# Every env var an API key can be read from (ours and litellm's)
+_ALL_API_KEY_ENV_VARS = tuple(sorted(set(API_KEY_ENV_VARS.values()) | set(_LITELLM_API_KEY_ENV.values())))
+
+
+# Precompiled per-provider patterns for missing-key error messages
+_MISSING_KEY_PATTERNS = {
+    provider: re.compile(re.escape(env_var)) for provider, env_var in API_KEY_ENV_VARS.items()
+}
+
+
+def _return_none(*args, **kwargs):
+    """Credential lookup stub shared by every test."""
+    return None
+
+
+@pytest.fixture(autouse=True)
+def _no_keychain_credentials(monkeypatch):
+    """Keep tests off the real system keychain; keys come from env only."""
+    monkeypatch.setattr("hunknote.global_config.get_credential", _return_none)
+
+
+@pytest.fixture
+def empty_env(monkeypatch):
+    """Remove all API key env vars without copying the whole environment."""
+    for env_var in _ALL_API_KEY_ENV_VARS:
+        monkeypatch.delenv(env_var, raising=False)
+
+
+# ============================================================
+# Default-constructed providers
+# ============================================================
+
+@pytest.fixture
+def anthropic_provider():
+    """Default-constructed Anthropic provider."""
+    return LiteLLMProvider(LLMProvider.ANTHROPIC, "claude-sonnet-4-20250514")
+
+
+@pytest.fixture
+def openai_provider():
+    """Default-constructed OpenAI provider."""
+    return LiteLLMProvider(LLMProvider.OPENAI, "gpt-4o")
+
+
+@pytest.fixture
+def google_provider():
+    """Default-constructed Google provider."""
+    return LiteLLMProvider(LLMProvider.GOOGLE, "gemini-2.0-flash")
 
 
 # ============================================================
@@ -144,40 +202,36 @@ class TestLiteLLMProviderInit:
 class TestLiteLLMProviderApiKey:
     """Tests for API key resolution in LiteLLMProvider."""
 
-    def test_gets_key_from_env(self):
-        p = LiteLLMProvider(LLMProvider.ANTHROPIC, "claude-sonnet-4-20250514")
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key-123"}):
-            assert p.get_api_key() == "test-key-123"
+    def test_gets_key_from_env(self, anthropic_provider, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key-123")
+        assert anthropic_provider.get_api_key() == "test-key-123"
 
-    def test_gets_key_from_keyring(self):
-        p = LiteLLMProvider(LLMProvider.OPENAI, "gpt-4o")
-        with patch.dict(os.environ, {}, clear=True):
-            with patch("hunknote.global_config.get_credential", return_value="keyring-key"):
-                assert p.get_api_key() == "keyring-key"
+    def test_gets_key_from_keyring(self, openai_provider, empty_env, monkeypatch):
+        monkeypatch.setattr(
+            "hunknote.global_config.get_credential", lambda *args, **kwargs: "keyring-key"
+        )
+        assert openai_provider.get_api_key() == "keyring-key"
 
-    def test_missing_key_raises_error(self):
-        p = LiteLLMProvider(LLMProvider.GOOGLE, "gemini-2.0-flash")
-        with patch.dict(os.environ, {}, clear=True):
-            with patch("hunknote.global_config.get_credential", return_value=None):
-                with pytest.raises(MissingAPIKeyError) as exc_info:
-                    p.get_api_key()
-                assert "GOOGLE_API_KEY" in str(exc_info.value)
+    @pytest.mark.parametrize("llm_provider", list(LLMProvider), ids=lambda p: p.value)
+    def test_missing_key_raises_error(self, llm_provider, empty_env):
+        p = LiteLLMProvider(llm_provider, "test-model")
+        with pytest.raises(MissingAPIKeyError) as exc_info:
+            p.get_api_key()
+        exc_info.match(_MISSING_KEY_PATTERNS[llm_provider])
 
-    def test_inject_api_key_sets_gemini_env(self):
+    def test_inject_api_key_sets_gemini_env(self, empty_env, monkeypatch):
         """For Google, inject sets GEMINI_API_KEY so litellm can find it."""
         p = LiteLLMProvider(LLMProvider.GOOGLE, "gemini-2.0-flash")
-        with patch.dict(os.environ, {"GOOGLE_API_KEY": "google-key"}, clear=True):
-            p._inject_api_key_for_litellm()
-            assert os.environ.get("GEMINI_API_KEY") == "google-key"
+        monkeypatch.setenv("GOOGLE_API_KEY", "google-key")
+        p._inject_api_key_for_litellm()
+        assert os.environ.get("GEMINI_API_KEY") == "google-key"
 
-    def test_inject_api_key_all_providers(self):
+    @pytest.mark.parametrize("llm_provider", list(LLMProvider), ids=lambda p: p.value)
+    def test_inject_api_key_all_providers(self, llm_provider, empty_env, monkeypatch):
         """API key injection works for every provider without errors."""
-        for provider in LLMProvider:
-            p = LiteLLMProvider(provider, "test-model")
-            env_var = p.api_key_env_var
-            with patch.dict(os.environ, {env_var: "test-key"}, clear=True):
-                key = p._inject_api_key_for_litellm()
-                assert key == "test-key"
+        p = LiteLLMProvider(llm_provider, "test-model")
+        monkeypatch.setenv(p.api_key_env_var, "test-key")
+        assert p._inject_api_key_for_litellm() == "test-key"
 
 
 # ============================================================
@@ -187,8 +241,8 @@ class TestLiteLLMProviderApiKey:
 class TestEffectiveMaxTokens:
     """Tests for _effective_max_tokens method."""
 
-    def test_regular_model_uses_config(self):
-        p = LiteLLMProvider(LLMProvider.OPENAI, "gpt-4o")
+    def test_regular_model_uses_config(self, openai_provider):
+        p = openai_provider
         with patch("hunknote.config.MAX_TOKENS", 1500):
             assert p._effective_max_tokens() == 1500
 
@@ -197,8 +251,8 @@ class TestEffectiveMaxTokens:
         with patch("hunknote.config.MAX_TOKENS", 1500):
             assert p._effective_max_tokens() == 1500 * 3
 
-    def test_raw_mode_floor(self):
-        p = LiteLLMProvider(LLMProvider.OPENAI, "gpt-4o")
+    def test_raw_mode_floor(self, openai_provider):
+        p = openai_provider
         with patch("hunknote.config.MAX_TOKENS", 1500):
             assert p._effective_max_tokens(for_raw=True) == 8192
 
@@ -207,9 +261,9 @@ class TestEffectiveMaxTokens:
         with patch("hunknote.config.MAX_TOKENS", 1500):
             assert p._effective_max_tokens(for_raw=True) == 8192 * 3
 
-    def test_raw_mode_large_config(self):
+    def test_raw_mode_large_config(self, openai_provider):
         """If MAX_TOKENS > 8192, raw mode uses the larger value."""
-        p = LiteLLMProvider(LLMProvider.OPENAI, "gpt-4o")
+        p = openai_provider
         with patch("hunknote.config.MAX_TOKENS", 10000):
             assert p._effective_max_tokens(for_raw=True) == 10000
 
@@ -285,19 +339,16 @@ class TestLiteLLMProviderGenerate:
             assert messages[1]["role"] == "user"
             assert "context" in messages[1]["content"]
 
-    def test_generate_raises_on_missing_key(self):
+    def test_generate_raises_on_missing_key(self, empty_env):
         p = LiteLLMProvider(LLMProvider.OPENAI, "gpt-4o")
-        with patch.dict(os.environ, {}, clear=True):
-            with patch("hunknote.global_config.get_credential", return_value=None):
-                with pytest.raises(MissingAPIKeyError):
-                    p.generate("context")
+        with pytest.raises(MissingAPIKeyError):
+            p.generate("context")
 
     def test_generate_wraps_litellm_errors(self):
         p = LiteLLMProvider(LLMProvider.OPENAI, "gpt-4o")
 
         with patch.dict(os.environ, {"OPENAI_API_KEY": "key"}):
             with patch("litellm.completion", side_effect=Exception("connection failed")):
-                from hunknote.llm.base import LLMError
                 with pytest.raises(LLMError) as exc_info:
                     p.generate("context")
                 assert "connection failed" in str(exc_info.value)
@@ -364,7 +415,6 @@ class TestLiteLLMProviderGenerateRaw:
 
         with patch.dict(os.environ, {"OPENAI_API_KEY": "key"}):
             with patch("litellm.completion", return_value=mock_resp):
-                from hunknote.llm.base import LLMError
                 with pytest.raises(LLMError) as exc_info:
                     p.generate_raw("system", "user")
                 assert "empty response" in str(exc_info.value)
@@ -387,33 +437,13 @@ class TestLiteLLMProviderGenerateRaw:
 # ============================================================
 
 class TestGetProviderIntegration:
-    """Test that get_provider returns LiteLLMProvider for all providers."""
-
-    def test_all_providers_return_litellm_provider(self):
-        from hunknote.llm import get_provider
-
-        for provider in LLMProvider:
-            result = get_provider(provider)
-            assert isinstance(result, LiteLLMProvider)
-            assert result.provider == provider
+    """Test that hunknote.llm entry points dispatch through LiteLLMProvider.
 
-    def test_model_passthrough(self):
-        from hunknote.llm import get_provider
-
-        result = get_provider(LLMProvider.OPENAI, model="gpt-4-turbo")
-        assert result.model == "gpt-4-turbo"
-
-    def test_style_passthrough(self):
-        from hunknote.llm import get_provider
-
-        result = get_provider(LLMProvider.GOOGLE, style="kernel")
-        assert result.style == "kernel"
+    get_provider() itself is covered in tests/test_llm_providers.py.
+    """
 
     def test_generate_commit_json_uses_litellm(self, mocker):
         """generate_commit_json dispatches through LiteLLMProvider."""
-        from hunknote.llm import generate_commit_json
-        from hunknote.styles import ExtendedCommitJSON
-
         mock_result = LLMResult(
             commit_json=ExtendedCommitJSON(title="Test", body_bullets=["Change"]),
             model="test-model",
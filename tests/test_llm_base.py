@@ -1,10 +1,12 @@
 """Tests for hunknote.llm.base module."""
 
 import os
+from types import SimpleNamespace
 
 import pytest
 
 from hunknote.formatters import CommitMessageJSON
+from hunknote.styles import ExtendedCommitJSON
 from hunknote.llm.base import (
     JSONParseError,
     LLMError,
@@ -17,6 +19,35 @@ from hunknote.llm.base import (
 )
 
 
+# Lightweight stand-in for tests that treat commit_json as opaque
+_SAMPLE_COMMIT = SimpleNamespace(title="Test", body_bullets=["Change 1"])
+
+
+@pytest.fixture(scope="module")
+def style_templates():
+    """Map of style name to user prompt template."""
+    from hunknote.llm.base import (
+        USER_PROMPT_TEMPLATE_DEFAULT,
+        USER_PROMPT_TEMPLATE_BLUEPRINT,
+        USER_PROMPT_TEMPLATE_CONVENTIONAL,
+        USER_PROMPT_TEMPLATE_TICKET,
+        USER_PROMPT_TEMPLATE_KERNEL,
+    )
+    return {
+        "default": USER_PROMPT_TEMPLATE_DEFAULT,
+        "blueprint": USER_PROMPT_TEMPLATE_BLUEPRINT,
+        "conventional": USER_PROMPT_TEMPLATE_CONVENTIONAL,
+        "ticket": USER_PROMPT_TEMPLATE_TICKET,
+        "kernel": USER_PROMPT_TEMPLATE_KERNEL,
+    }
+
+
+@pytest.fixture(scope="module")
+def style_templates_lower(style_templates):
+    """Lowercased style templates, computed once for case-insensitive checks."""
+    return {name: template.lower() for name, template in style_templates.items()}
+
+
 class TestExceptions:
     """Tests for LLM exception classes."""
 
@@ -55,17 +86,14 @@ class TestLLMResult:
         assert result.model == "gpt-4"
         assert result.input_tokens == 100
         assert result.output_tokens == 50
+        assert result.commit_json is commit_json
         assert result.commit_json.title == "Test"
 
     def test_create_result_with_raw_response(self):
         """Test creating LLMResult with raw_response."""
-        commit_json = CommitMessageJSON(
-            title="Test",
-            body_bullets=["Change 1"],
-        )
         raw = '{"title": "Test", "body_bullets": ["Change 1"]}'
         result = LLMResult(
-            commit_json=commit_json,
+            commit_json=_SAMPLE_COMMIT,
             model="gpt-4",
             input_tokens=100,
             output_tokens=50,
@@ -76,12 +104,8 @@ class TestLLMResult:
 
     def test_raw_response_default_empty(self):
         """Test that raw_response defaults to empty string."""
-        commit_json = CommitMessageJSON(
-            title="Test",
-            body_bullets=["Change 1"],
-        )
         result = LLMResult(
-            commit_json=commit_json,
+            commit_json=_SAMPLE_COMMIT,
             model="gpt-4",
             input_tokens=100,
             output_tokens=50,
@@ -91,12 +115,8 @@ class TestLLMResult:
 
     def test_create_result_with_char_counts(self):
         """Test creating LLMResult with character counts."""
-        commit_json = CommitMessageJSON(
-            title="Test",
-            body_bullets=["Change 1"],
-        )
         result = LLMResult(
-            commit_json=commit_json,
+            commit_json=_SAMPLE_COMMIT,
             model="gpt-4",
             input_tokens=100,
             output_tokens=50,
@@ -111,12 +131,8 @@ class TestLLMResult:
 
     def test_char_counts_default_to_zero(self):
         """Test that character counts default to zero."""
-        commit_json = CommitMessageJSON(
-            title="Test",
-            body_bullets=["Change 1"],
-        )
         result = LLMResult(
-            commit_json=commit_json,
+            commit_json=_SAMPLE_COMMIT,
             model="gpt-4",
             input_tokens=100,
             output_tokens=50,
@@ -126,6 +142,21 @@ class TestLLMResult:
         assert result.prompt_chars == 0
         assert result.output_chars == 0
 
+    def test_result_is_immutable(self):
+        """Test that LLMResult fields cannot be reassigned."""
+        import dataclasses
+
+        result = LLMResult(
+            commit_json=_SAMPLE_COMMIT,
+            model="gpt-4",
+            input_tokens=100,
+            output_tokens=50,
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.model = "other"
+        assert not hasattr(result, "__dict__")
+
 
 class TestParseJsonResponse:
     """Tests for parse_json_response function."""
@@ -194,6 +225,19 @@ That's the response.'''
         with pytest.raises(JSONParseError):
             parse_json_response("")
 
+    def test_raises_on_whitespace_only_response(self):
+        """Test that whitespace-only response raises JSONParseError."""
+        with pytest.raises(JSONParseError) as exc_info:
+            parse_json_response("  \n\t ")
+
+        assert "Failed to parse" in str(exc_info.value)
+
+    def test_braces_inside_strings_are_not_counted(self):
+        """Test that unbalanced braces inside JSON strings still parse."""
+        result = parse_json_response('{"title": "Fix {unclosed brace", "body_bullets": []}')
+
+        assert result["title"] == "Fix {unclosed brace"
+
     def test_error_includes_raw_response(self):
         """Test that error includes raw response."""
         response = "not json at all"
@@ -217,13 +261,32 @@ That's the response.'''
         assert result["title"] == "Multi-line title"
         assert len(result["body_bullets"]) == 2
 
+    def test_nested_object_with_surrounding_text(self):
+        """Test that a nested object is decoded from between prose."""
+        response = 'Here:\n{"title": "Test", "extra": {"nested": [1, 2]}}\nDone.'
+
+        assert parse_json_response(response) == {"title": "Test", "extra": {"nested": [1, 2]}}
+
+    def test_raises_on_multiple_objects(self):
+        """Test that two JSON values between the outer braces are rejected."""
+        with pytest.raises(JSONParseError):
+            parse_json_response('{"a": 1} and {"b": 2}')
+
+    def test_stdlib_decoding_contract(self):
+        """Test big ints, lone surrogates and NaN decode as the json module does."""
+        result = parse_json_response('{"big": 123456789012345678901234567890, "s": "\\ud800", "n": NaN}')
+
+        assert result["big"] == 123456789012345678901234567890
+        assert isinstance(result["big"], int)
+        assert result["s"] == "\ud800"
+        assert result["n"] != result["n"]  # NaN
+
 
 class TestValidateCommitJson:
     """Tests for validate_commit_json function with ExtendedCommitJSON."""
 
     def test_validates_correct_schema(self):
         """Test validation of correct schema returns ExtendedCommitJSON."""
-        from hunknote.styles import ExtendedCommitJSON
         parsed = {
             "title": "Add feature",
             "body_bullets": ["Change 1", "Change 2"],
@@ -348,129 +411,84 @@ class TestPromptTemplates:
         formatted = USER_PROMPT_TEMPLATE.format(context_bundle="test context")
         assert "test context" in formatted
 
+    @pytest.mark.parametrize("style", ["default", "blueprint", "conventional", "ticket", "kernel"])
+    def test_split_template_matches_format(self, style_templates, style):
+        """Test that pre-split templates render exactly like str.format."""
+        from hunknote.llm.base import _STYLE_TEMPLATE_PARTS
 
-class TestStyleSpecificPromptTemplates:
-    """Tests for style-specific prompt templates."""
-
-    def test_default_template_exists(self):
-        """Test that default template exists."""
-        from hunknote.llm.base import USER_PROMPT_TEMPLATE_DEFAULT
-        assert "{context_bundle}" in USER_PROMPT_TEMPLATE_DEFAULT
-        assert "title" in USER_PROMPT_TEMPLATE_DEFAULT
-        assert "body_bullets" in USER_PROMPT_TEMPLATE_DEFAULT
-
-    def test_conventional_template_exists(self):
-        """Test that conventional template exists."""
-        from hunknote.llm.base import USER_PROMPT_TEMPLATE_CONVENTIONAL
-        assert "{context_bundle}" in USER_PROMPT_TEMPLATE_CONVENTIONAL
-        assert "type" in USER_PROMPT_TEMPLATE_CONVENTIONAL
-        assert "scope" in USER_PROMPT_TEMPLATE_CONVENTIONAL
-        assert "subject" in USER_PROMPT_TEMPLATE_CONVENTIONAL
-        assert "feat" in USER_PROMPT_TEMPLATE_CONVENTIONAL
-        assert "fix" in USER_PROMPT_TEMPLATE_CONVENTIONAL
-
-    def test_ticket_template_exists(self):
-        """Test that ticket template exists."""
-        from hunknote.llm.base import USER_PROMPT_TEMPLATE_TICKET
-        assert "{context_bundle}" in USER_PROMPT_TEMPLATE_TICKET
-        assert "ticket" in USER_PROMPT_TEMPLATE_TICKET
-        assert "subject" in USER_PROMPT_TEMPLATE_TICKET
-        assert "PROJ-123" in USER_PROMPT_TEMPLATE_TICKET or "ABC-123" in USER_PROMPT_TEMPLATE_TICKET
-
-    def test_kernel_template_exists(self):
-        """Test that kernel template exists."""
-        from hunknote.llm.base import USER_PROMPT_TEMPLATE_KERNEL
-        assert "{context_bundle}" in USER_PROMPT_TEMPLATE_KERNEL
-        assert "subsystem" in USER_PROMPT_TEMPLATE_KERNEL
-        assert "subject" in USER_PROMPT_TEMPLATE_KERNEL
-
-    def test_conventional_template_has_all_types(self):
-        """Test that conventional template includes all commit types."""
-        from hunknote.llm.base import USER_PROMPT_TEMPLATE_CONVENTIONAL
-        types = ["feat", "fix", "docs", "refactor", "perf", "test", "build", "ci", "chore", "style", "revert"]
-        for commit_type in types:
-            assert commit_type in USER_PROMPT_TEMPLATE_CONVENTIONAL
-
-    def test_conventional_template_mentions_breaking_change(self):
-        """Test that conventional template mentions breaking changes."""
-        from hunknote.llm.base import USER_PROMPT_TEMPLATE_CONVENTIONAL
-        assert "breaking_change" in USER_PROMPT_TEMPLATE_CONVENTIONAL
+        context = "ctx with {braces}"
+        prefix, suffix = _STYLE_TEMPLATE_PARTS[style]
+        expected = style_templates[style].format(context_bundle=context)
+        assert prefix + context + suffix == expected
 
-    def test_ticket_template_mentions_branch_extraction(self):
-        """Test that ticket template mentions extracting from branch."""
-        from hunknote.llm.base import USER_PROMPT_TEMPLATE_TICKET
-        assert "branch" in USER_PROMPT_TEMPLATE_TICKET.lower()
-
-    def test_kernel_template_mentions_lowercase(self):
-        """Test that kernel template mentions lowercase preference."""
-        from hunknote.llm.base import USER_PROMPT_TEMPLATE_KERNEL
-        assert "lowercase" in USER_PROMPT_TEMPLATE_KERNEL.lower()
 
-    def test_blueprint_template_exists(self):
-        """Test that blueprint template exists."""
-        from hunknote.llm.base import USER_PROMPT_TEMPLATE_BLUEPRINT
-        assert "{context_bundle}" in USER_PROMPT_TEMPLATE_BLUEPRINT
-        assert "type" in USER_PROMPT_TEMPLATE_BLUEPRINT
-        assert "summary" in USER_PROMPT_TEMPLATE_BLUEPRINT
-        assert "sections" in USER_PROMPT_TEMPLATE_BLUEPRINT
-
-    def test_blueprint_template_has_allowed_sections(self):
-        """Test that blueprint template lists allowed section titles."""
-        from hunknote.llm.base import USER_PROMPT_TEMPLATE_BLUEPRINT
-        assert "Changes" in USER_PROMPT_TEMPLATE_BLUEPRINT
-        assert "Implementation" in USER_PROMPT_TEMPLATE_BLUEPRINT
-        assert "Testing" in USER_PROMPT_TEMPLATE_BLUEPRINT
-        assert "Documentation" in USER_PROMPT_TEMPLATE_BLUEPRINT
-        assert "Notes" in USER_PROMPT_TEMPLATE_BLUEPRINT
-
-    def test_blueprint_template_mentions_optional_sections(self):
-        """Test that blueprint template mentions quality guidelines."""
-        from hunknote.llm.base import USER_PROMPT_TEMPLATE_BLUEPRINT
-        # The new prompt focuses on quality guidelines rather than optional sections
-        assert "QUALITY GUIDELINES" in USER_PROMPT_TEMPLATE_BLUEPRINT
-        assert "specific and informative" in USER_PROMPT_TEMPLATE_BLUEPRINT
-
-    def test_all_templates_mention_json(self):
-        """Test that all templates mention JSON output."""
-        from hunknote.llm.base import (
-            USER_PROMPT_TEMPLATE_DEFAULT,
-            USER_PROMPT_TEMPLATE_BLUEPRINT,
-            USER_PROMPT_TEMPLATE_CONVENTIONAL,
-            USER_PROMPT_TEMPLATE_TICKET,
-            USER_PROMPT_TEMPLATE_KERNEL,
-        )
-        for template in [USER_PROMPT_TEMPLATE_DEFAULT, USER_PROMPT_TEMPLATE_BLUEPRINT,
-                         USER_PROMPT_TEMPLATE_CONVENTIONAL, USER_PROMPT_TEMPLATE_TICKET,
-                         USER_PROMPT_TEMPLATE_KERNEL]:
-            assert "JSON" in template
+class TestStyleSpecificPromptTemplates:
+    """Tests for style-specific prompt templates."""
 
-    def test_all_templates_mention_file_changes(self):
+    @pytest.mark.parametrize(
+        "style,keyword",
+        [
+            ("default", "title"),
+            ("default", "body_bullets"),
+            ("conventional", "type"),
+            ("conventional", "scope"),
+            ("conventional", "subject"),
+            ("conventional", "breaking_change"),
+            *[("conventional", t) for t in [
+                "feat", "fix", "docs", "refactor", "perf", "test",
+                "build", "ci", "chore", "style", "revert",
+            ]],
+            ("ticket", "ticket"),
+            ("ticket", "subject"),
+            ("kernel", "subsystem"),
+            ("kernel", "subject"),
+            ("blueprint", "type"),
+            ("blueprint", "summary"),
+            ("blueprint", "sections"),
+            *[("blueprint", t) for t in [
+                "Changes", "Implementation", "Testing", "Documentation", "Notes",
+            ]],
+            # The blueprint prompt focuses on quality guidelines rather than optional sections
+            ("blueprint", "QUALITY GUIDELINES"),
+            ("blueprint", "specific and informative"),
+        ],
+    )
+    def test_template_mentions(self, style_templates, style, keyword):
+        """Test that a style template mentions a required keyword."""
+        assert keyword in style_templates[style]
+
+    @pytest.mark.parametrize(
+        "style,keyword",
+        [
+            ("ticket", "branch"),
+            ("kernel", "lowercase"),
+        ],
+    )
+    def test_template_mentions_case_insensitive(self, style_templates_lower, style, keyword):
+        """Test that a style template mentions a keyword in any case."""
+        assert keyword in style_templates_lower[style]
+
+    def test_ticket_template_has_example_key(self, style_templates):
+        """Test that ticket template includes an example ticket key."""
+        template = style_templates["ticket"]
+        assert "PROJ-123" in template or "ABC-123" in template
+
+    @pytest.mark.parametrize("style", ["default", "blueprint", "conventional", "ticket", "kernel"])
+    def test_template_has_placeholder_and_json(self, style_templates, style):
+        """Test that every template has the placeholder and mentions JSON output."""
+        assert "{context_bundle}" in style_templates[style]
+        assert "JSON" in style_templates[style]
+
+    @pytest.mark.parametrize("style", ["default", "conventional", "ticket", "kernel"])
+    def test_template_mentions_file_changes(self, style_templates, style):
         """Test that non-blueprint templates mention FILE_CHANGES section."""
-        from hunknote.llm.base import (
-            USER_PROMPT_TEMPLATE_DEFAULT,
-            USER_PROMPT_TEMPLATE_CONVENTIONAL,
-            USER_PROMPT_TEMPLATE_TICKET,
-            USER_PROMPT_TEMPLATE_KERNEL,
-        )
         # Blueprint uses a different format focused on quality guidelines
-        for template in [USER_PROMPT_TEMPLATE_DEFAULT,
-                         USER_PROMPT_TEMPLATE_CONVENTIONAL, USER_PROMPT_TEMPLATE_TICKET,
-                         USER_PROMPT_TEMPLATE_KERNEL]:
-            assert "FILE_CHANGES" in template
+        assert "FILE_CHANGES" in style_templates[style]
 
-    def test_all_templates_can_be_formatted(self):
+    def test_all_templates_can_be_formatted(self, style_templates):
         """Test that all templates can be formatted with context_bundle."""
-        from hunknote.llm.base import (
-            USER_PROMPT_TEMPLATE_DEFAULT,
-            USER_PROMPT_TEMPLATE_BLUEPRINT,
-            USER_PROMPT_TEMPLATE_CONVENTIONAL,
-            USER_PROMPT_TEMPLATE_TICKET,
-            USER_PROMPT_TEMPLATE_KERNEL,
-        )
         test_context = "test git context here"
-        for template in [USER_PROMPT_TEMPLATE_DEFAULT, USER_PROMPT_TEMPLATE_BLUEPRINT,
-                         USER_PROMPT_TEMPLATE_CONVENTIONAL, USER_PROMPT_TEMPLATE_TICKET,
-                         USER_PROMPT_TEMPLATE_KERNEL]:
+        for template in style_templates.values():
             formatted = template.format(context_bundle=test_context)
             assert test_context in formatted
 
@@ -921,6 +939,34 @@ Hope this helps!'''
 
         assert 'quoted' in result["title"]
 
+    def test_removes_fences_around_json_array(self):
+        """Test that fenced top-level JSON arrays are unwrapped."""
+        response = '''```json
+["Change 1", "Change 2"]
+```'''
+        result = parse_json_response(response)
+
+        assert result == ["Change 1", "Change 2"]
+
+    def test_removes_fences_with_surrounding_whitespace(self):
+        """Test that fences are detected despite leading/trailing whitespace."""
+        response = '''
+  ```json
+["Change 1"]
+```
+'''
+        result = parse_json_response(response)
+
+        assert result == ["Change 1"]
+
+    def test_handles_unclosed_markdown_fence(self):
+        """Test that a missing closing fence does not break parsing."""
+        response = '''```json
+{"title": "Test", "body_bullets": ["Change"]}'''
+        result = parse_json_response(response)
+
+        assert result["title"] == "Test"
+
     def test_handles_json_arrays_in_objects(self):
         """Test handling complex nested structures."""
         response = '''{"title": "Test", "body_bullets": ["Change"], "sections": [{"title": "Changes", "bullets": ["Item 1", "Item 2"]}]}'''
@@ -937,7 +983,6 @@ class TestGenerateCommitJson:
     def test_generate_commit_json_calls_provider(self, mocker):
         """Test that generate_commit_json uses the correct provider."""
         from hunknote.llm import generate_commit_json
-        from hunknote.styles import ExtendedCommitJSON
 
         mock_result = LLMResult(
             commit_json=ExtendedCommitJSON(title="Test", body_bullets=["Change"]),
@@ -959,7 +1004,6 @@ class TestGenerateCommitJson:
     def test_generate_commit_json_with_style(self, mocker):
         """Test that generate_commit_json passes style to get_provider."""
         from hunknote.llm import generate_commit_json
-        from hunknote.styles import ExtendedCommitJSON
 
         mock_result = LLMResult(
             commit_json=ExtendedCommitJSON(title="Test", body_bullets=["Change"]),
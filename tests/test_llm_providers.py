@@ -13,47 +13,12 @@ class TestGetProvider:
     All providers are now routed through the unified LiteLLMProvider.
     """
 
-    def test_returns_anthropic_provider(self):
-        """Test getting Anthropic provider returns LiteLLMProvider."""
-        provider = get_provider(LLMProvider.ANTHROPIC)
+    @pytest.mark.parametrize("llm_provider", list(LLMProvider), ids=lambda p: p.value)
+    def test_returns_provider(self, llm_provider):
+        """Test that every provider is served by LiteLLMProvider."""
+        provider = get_provider(llm_provider)
         assert isinstance(provider, LiteLLMProvider)
-        assert provider.provider == LLMProvider.ANTHROPIC
-
-    def test_returns_openai_provider(self):
-        """Test getting OpenAI provider returns LiteLLMProvider."""
-        provider = get_provider(LLMProvider.OPENAI)
-        assert isinstance(provider, LiteLLMProvider)
-        assert provider.provider == LLMProvider.OPENAI
-
-    def test_returns_google_provider(self):
-        """Test getting Google provider returns LiteLLMProvider."""
-        provider = get_provider(LLMProvider.GOOGLE)
-        assert isinstance(provider, LiteLLMProvider)
-        assert provider.provider == LLMProvider.GOOGLE
-
-    def test_returns_mistral_provider(self):
-        """Test getting Mistral provider returns LiteLLMProvider."""
-        provider = get_provider(LLMProvider.MISTRAL)
-        assert isinstance(provider, LiteLLMProvider)
-        assert provider.provider == LLMProvider.MISTRAL
-
-    def test_returns_cohere_provider(self):
-        """Test getting Cohere provider returns LiteLLMProvider."""
-        provider = get_provider(LLMProvider.COHERE)
-        assert isinstance(provider, LiteLLMProvider)
-        assert provider.provider == LLMProvider.COHERE
-
-    def test_returns_groq_provider(self):
-        """Test getting Groq provider returns LiteLLMProvider."""
-        provider = get_provider(LLMProvider.GROQ)
-        assert isinstance(provider, LiteLLMProvider)
-        assert provider.provider == LLMProvider.GROQ
-
-    def test_returns_openrouter_provider(self):
-        """Test getting OpenRouter provider returns LiteLLMProvider."""
-        provider = get_provider(LLMProvider.OPENROUTER)
-        assert isinstance(provider, LiteLLMProvider)
-        assert provider.provider == LLMProvider.OPENROUTER
+        assert provider.provider == llm_provider
 
     def test_custom_model(self):
         """Test provider with custom model."""
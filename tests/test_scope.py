@@ -1,12 +1,10 @@
 """Tests for hunknote.scope module."""
 
+import pytest
 
 from hunknote.scope import (
     ScopeStrategy,
     ScopeConfig,
-    ScopeResult,
-    DEFAULT_STOP_WORDS,
-    DEFAULT_MONOREPO_ROOTS,
     normalize_path,
     get_path_segments,
     is_docs_file,
@@ -17,31 +15,39 @@ from hunknote.scope import (
     infer_scope,
     load_scope_config_from_dict,
     scope_config_to_dict,
+    ScopeResult,
+    DEFAULT_STOP_WORDS,
+    DEFAULT_MONOREPO_ROOTS,
 )
 
 
-class TestScopeStrategy:
-    """Tests for ScopeStrategy enum."""
+# ============================================================
+# Shared file sets (tuples, built once at import)
+# ============================================================
 
-    def test_has_auto(self):
-        """Test that AUTO strategy exists."""
-        assert ScopeStrategy.AUTO.value == "auto"
+_API_ROUTE_FILES = ("src/api/routes.py",)
+_SRC_API_FILES = ("src/api/routes.py", "src/api/models.py")
+_API_FILES = ("api/routes.py", "api/models.py", "api/utils.py")
+_AUTH_FILES = ("packages/auth/login.py", "packages/auth/logout.py")
 
-    def test_has_monorepo(self):
-        """Test that MONOREPO strategy exists."""
-        assert ScopeStrategy.MONOREPO.value == "monorepo"
 
-    def test_has_path_prefix(self):
-        """Test that PATH_PREFIX strategy exists."""
-        assert ScopeStrategy.PATH_PREFIX.value == "path-prefix"
-
-    def test_has_mapping(self):
-        """Test that MAPPING strategy exists."""
-        assert ScopeStrategy.MAPPING.value == "mapping"
+class TestScopeStrategy:
+    """Tests for ScopeStrategy enum."""
 
-    def test_has_none(self):
-        """Test that NONE strategy exists."""
-        assert ScopeStrategy.NONE.value == "none"
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (ScopeStrategy.AUTO, "auto"),
+            (ScopeStrategy.MONOREPO, "monorepo"),
+            (ScopeStrategy.PATH_PREFIX, "path-prefix"),
+            (ScopeStrategy.MAPPING, "mapping"),
+            (ScopeStrategy.NONE, "none"),
+        ],
+        ids=lambda v: v.name.lower() if isinstance(v, ScopeStrategy) else None,
+    )
+    def test_value(self, member, value):
+        """Test that each strategy exists with its config value."""
+        assert member.value == value
 
 
 class TestScopeConfig:
@@ -71,83 +77,73 @@ class TestScopeConfig:
 class TestNormalizePath:
     """Tests for normalize_path function."""
 
-    def test_forward_slashes(self):
-        """Test that forward slashes are preserved."""
-        assert normalize_path("src/api/routes.py") == "src/api/routes.py"
-
-    def test_backslashes_converted(self):
-        """Test that backslashes are converted."""
-        assert normalize_path("src\\api\\routes.py") == "src/api/routes.py"
-
-    def test_strips_leading_trailing_slashes(self):
-        """Test that leading/trailing slashes are stripped."""
-        assert normalize_path("/src/api/") == "src/api"
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("src/api/routes.py", "src/api/routes.py"),
+            ("src\\api\\routes.py", "src/api/routes.py"),
+            ("/src/api/", "src/api"),
+        ],
+        ids=["forward_slashes", "backslashes_converted", "strips_leading_trailing_slashes"],
+    )
+    def test_normalize_path(self, path, expected):
+        """Test slash conversion and stripping."""
+        assert normalize_path(path) == expected
 
 
 class TestGetPathSegments:
     """Tests for get_path_segments function."""
 
-    def test_returns_directory_segments(self):
-        """Test extraction of directory segments."""
-        segments = get_path_segments("src/api/routes.py", max_depth=2)
-        assert segments == ["src", "api"]
-
-    def test_respects_max_depth(self):
-        """Test that max_depth is respected."""
-        segments = get_path_segments("a/b/c/d/file.py", max_depth=2)
-        assert segments == ["a", "b"]
-
-    def test_empty_for_root_file(self):
-        """Test empty list for root-level file."""
-        segments = get_path_segments("file.py", max_depth=2)
-        assert segments == []
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("src/api/routes.py", ["src", "api"]),
+            ("a/b/c/d/file.py", ["a", "b"]),
+            ("file.py", []),
+        ],
+        ids=["returns_directory_segments", "respects_max_depth", "empty_for_root_file"],
+    )
+    def test_get_path_segments(self, path, expected):
+        """Test directory segment extraction up to max_depth."""
+        assert get_path_segments(path, max_depth=2) == expected
 
 
 class TestIsDocsFile:
     """Tests for is_docs_file function."""
 
-    def test_markdown_file(self):
-        """Test markdown file detection."""
-        assert is_docs_file("README.md") is True
-        assert is_docs_file("docs/guide.md") is True
-
-    def test_rst_file(self):
-        """Test RST file detection."""
-        assert is_docs_file("index.rst") is True
-
-    def test_docs_directory(self):
-        """Test docs directory detection."""
-        assert is_docs_file("docs/api/reference.py") is True
-        assert is_docs_file("documentation/guide.html") is True
-
-    def test_non_docs_file(self):
-        """Test non-docs file."""
-        assert is_docs_file("src/main.py") is False
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("README.md", True),
+            ("docs/guide.md", True),
+            ("index.rst", True),
+            ("docs/api/reference.py", True),
+            ("documentation/guide.html", True),
+            ("src/main.py", False),
+        ],
+    )
+    def test_is_docs_file(self, path, expected):
+        """Test docs detection by extension and directory."""
+        assert is_docs_file(path) is expected
 
 
 class TestIsTestFile:
     """Tests for is_test_file function."""
 
-    def test_test_prefix(self):
-        """Test test_ prefix detection."""
-        assert is_test_file("test_main.py") is True
-
-    def test_test_suffix(self):
-        """Test _test suffix detection."""
-        assert is_test_file("main_test.py") is True
-
-    def test_tests_directory(self):
-        """Test tests directory detection."""
-        assert is_test_file("tests/test_api.py") is True
-        assert is_test_file("test/unit/test_core.py") is True
-
-    def test_spec_file(self):
-        """Test spec file detection."""
-        assert is_test_file("main.spec.js") is True
-
-    def test_non_test_file(self):
-        """Test non-test file."""
-        assert is_test_file("src/main.py") is False
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("test_main.py", True),
+            ("main_test.py", True),
+            ("tests/test_api.py", True),
+            ("test/unit/test_core.py", True),
+            ("main.spec.js", True),
+            ("src/main.py", False),
+        ],
+    )
+    def test_is_test_file(self, path, expected):
+        """Test test-file detection by name pattern and directory."""
+        assert is_test_file(path) is expected
 
 
 class TestInferScopeFromMapping:
@@ -155,9 +151,8 @@ class TestInferScopeFromMapping:
 
     def test_simple_mapping(self):
         """Test simple path-to-scope mapping."""
-        files = ["src/api/routes.py", "src/api/models.py"]
         mapping = {"src/api/": "api"}
-        result = infer_scope_from_mapping(files, mapping)
+        result = infer_scope_from_mapping(_SRC_API_FILES, mapping)
 
         assert result is not None
         assert result.scope == "api"
@@ -165,7 +160,7 @@ class TestInferScopeFromMapping:
 
     def test_multiple_mappings(self):
         """Test multiple mappings with dominant scope."""
-        files = ["src/api/routes.py", "src/api/models.py", "src/web/app.py"]
+        files = (*_SRC_API_FILES, "src/web/app.py")
         mapping = {"src/api/": "api", "src/web/": "ui"}
         result = infer_scope_from_mapping(files, mapping)
 
@@ -182,8 +177,7 @@ class TestInferScopeFromMapping:
 
     def test_empty_mapping(self):
         """Test empty mapping."""
-        files = ["src/api/routes.py"]
-        result = infer_scope_from_mapping(files, {})
+        result = infer_scope_from_mapping(_API_ROUTE_FILES, {})
 
         assert result is None
 
@@ -210,11 +204,7 @@ class TestInferScopeFromMonorepo:
 
     def test_multiple_packages(self):
         """Test changes across multiple packages."""
-        files = [
-            "packages/auth/login.py",
-            "packages/auth/logout.py",
-            "packages/api/routes.py",
-        ]
+        files = (*_AUTH_FILES, "packages/api/routes.py")
         result = infer_scope_from_monorepo(files, ["packages/"])
 
         assert result is not None
@@ -234,8 +224,7 @@ class TestInferScopeFromPathPrefix:
 
     def test_common_segment(self):
         """Test inference from common path segment."""
-        files = ["api/routes.py", "api/models.py", "api/utils.py"]
-        result = infer_scope_from_path_prefix(files, max_depth=2)
+        result = infer_scope_from_path_prefix(_API_FILES, max_depth=2)
 
         assert result is not None
         assert result.scope == "api"
@@ -243,8 +232,7 @@ class TestInferScopeFromPathPrefix:
 
     def test_filters_stop_words(self):
         """Test that stop words are filtered."""
-        files = ["src/api/routes.py", "src/api/models.py"]
-        result = infer_scope_from_path_prefix(files, max_depth=2)
+        result = infer_scope_from_path_prefix(_SRC_API_FILES, max_depth=2)
 
         assert result is not None
         assert result.scope == "api"  # 'src' is filtered as stop word
@@ -265,96 +253,123 @@ class TestInferScopeFromPathPrefix:
         assert result is None
 
 
-class TestInferScope:
-    """Tests for main infer_scope function."""
-
-    def test_disabled_scope(self):
-        """Test when scope inference is disabled."""
-        config = ScopeConfig(enabled=False)
-        result = infer_scope(["src/api/routes.py"], config)
-
-        assert result.scope is None
-        assert result.strategy_used == ScopeStrategy.NONE
-        assert "disabled" in result.reason.lower()
-
-    def test_empty_files(self):
-        """Test with empty file list."""
-        result = infer_scope([])
-
-        assert result.scope is None
-        assert "No files" in result.reason
-
-    def test_all_docs_files(self):
-        """Test docs-only changes."""
-        config = ScopeConfig(docs_scope="docs")
-        files = ["README.md", "docs/guide.md"]
-        result = infer_scope(files, config)
-
-        assert result.scope == "docs"
-        assert "documentation" in result.reason.lower()
-
-    def test_monorepo_inference(self):
-        """Test monorepo strategy."""
-        config = ScopeConfig(
-            strategy=ScopeStrategy.MONOREPO,
-            monorepo_roots=["packages/"],
-        )
-        files = ["packages/auth/login.py", "packages/auth/logout.py"]
-        result = infer_scope(files, config)
-
-        assert result.scope == "auth"
-        assert result.strategy_used == ScopeStrategy.MONOREPO
-
-    def test_mapping_strategy(self):
-        """Test mapping strategy."""
-        config = ScopeConfig(
-            strategy=ScopeStrategy.MAPPING,
-            mapping={"src/api/": "api"},
-        )
-        files = ["src/api/routes.py"]
-        result = infer_scope(files, config)
+# ============================================================
+# infer_scope scenario table
+# ============================================================
+
+# (ScopeConfig or None for defaults, files, scope, strategy_used, reason substring or None)
+INFER_SCOPE_SCENARIOS = [
+    pytest.param(
+        ScopeConfig(enabled=False),
+        _API_ROUTE_FILES,
+        None,
+        ScopeStrategy.NONE,
+        "disabled",
+        id="disabled_scope",
+    ),
+    pytest.param(None, (), None, None, "No files", id="empty_files"),
+    pytest.param(
+        ScopeConfig(docs_scope="docs"),
+        ("README.md", "docs/guide.md"),
+        "docs",
+        ScopeStrategy.AUTO,
+        "documentation",
+        id="all_docs_files",
+    ),
+    pytest.param(
+        ScopeConfig(strategy=ScopeStrategy.MONOREPO, monorepo_roots=["packages/"]),
+        _AUTH_FILES,
+        "auth",
+        ScopeStrategy.MONOREPO,
+        None,
+        id="monorepo_inference",
+    ),
+    pytest.param(
+        ScopeConfig(strategy=ScopeStrategy.MAPPING, mapping={"src/api/": "api"}),
+        _API_ROUTE_FILES,
+        "api",
+        ScopeStrategy.MAPPING,
+        None,
+        id="mapping_strategy",
+    ),
+    # AUTO tries mapping first, then monorepo and path-prefix
+    pytest.param(
+        ScopeConfig(strategy=ScopeStrategy.AUTO, mapping={"src/api/": "api"}),
+        _API_ROUTE_FILES,
+        "api",
+        ScopeStrategy.MAPPING,
+        None,
+        id="auto_strategy_tries_all",
+    ),
+    # 3 files in api, 2 files in web = 60% confidence, below 70% threshold
+    pytest.param(
+        ScopeConfig(strategy=ScopeStrategy.PATH_PREFIX, dominant_threshold=0.7),
+        (*_API_FILES, "web/app.py", "web/index.py"),
+        None,
+        ScopeStrategy.PATH_PREFIX,
+        "Mixed changes",
+        id="mixed_changes_below_threshold",
+    ),
+    pytest.param(
+        ScopeConfig(strategy=ScopeStrategy.NONE),
+        _API_ROUTE_FILES,
+        None,
+        ScopeStrategy.NONE,
+        None,
+        id="none_strategy",
+    ),
+    # Real-world repository layouts (end-to-end; deselect with -m "not integration")
+    pytest.param(
+        ScopeConfig(strategy=ScopeStrategy.PATH_PREFIX),
+        ("myapp/api/views.py", "myapp/api/serializers.py", "myapp/api/urls.py"),
+        "api",
+        ScopeStrategy.PATH_PREFIX,
+        None,
+        id="django_project",
+        marks=pytest.mark.integration,
+    ),
+    pytest.param(
+        ScopeConfig(strategy=ScopeStrategy.PATH_PREFIX),
+        ("src/components/Button.jsx", "src/components/Input.jsx"),
+        "components",
+        ScopeStrategy.PATH_PREFIX,
+        None,
+        id="react_project",
+        marks=pytest.mark.integration,
+    ),
+    pytest.param(
+        ScopeConfig(strategy=ScopeStrategy.MONOREPO, monorepo_roots=["libs/", "apps/"]),
+        ("libs/shared-ui/src/Button.tsx", "libs/shared-ui/src/Input.tsx"),
+        "shared-ui",
+        ScopeStrategy.MONOREPO,
+        None,
+        id="nx_monorepo",
+        marks=pytest.mark.integration,
+    ),
+    pytest.param(
+        ScopeConfig(strategy=ScopeStrategy.PATH_PREFIX),
+        ("hunknote/cli.py", "hunknote/config.py", "hunknote/cache.py"),
+        "hunknote",
+        ScopeStrategy.PATH_PREFIX,
+        None,
+        id="python_package",
+        marks=pytest.mark.integration,
+    ),
+]
 
-        assert result.scope == "api"
-        assert result.strategy_used == ScopeStrategy.MAPPING
 
-    def test_auto_strategy_tries_all(self):
-        """Test that AUTO strategy tries multiple methods."""
-        config = ScopeConfig(
-            strategy=ScopeStrategy.AUTO,
-            mapping={"src/api/": "api"},
-        )
-        files = ["src/api/routes.py"]
-        result = infer_scope(files, config)
-
-        assert result.scope == "api"
-
-    def test_mixed_changes_below_threshold(self):
-        """Test mixed changes return no scope."""
-        config = ScopeConfig(
-            strategy=ScopeStrategy.PATH_PREFIX,
-            dominant_threshold=0.7,
-        )
-        # 3 files in api, 2 files in web = 60% confidence, below 70% threshold
-        files = [
-            "api/routes.py",
-            "api/models.py",
-            "api/utils.py",
-            "web/app.py",
-            "web/index.py",
-        ]
-        result = infer_scope(files, config)
-
-        assert result.scope is None
-        assert "Mixed changes" in result.reason
+class TestInferScope:
+    """Tests for main infer_scope function, including real-world layouts."""
 
-    def test_none_strategy(self):
-        """Test NONE strategy always returns no scope."""
-        config = ScopeConfig(strategy=ScopeStrategy.NONE)
-        files = ["src/api/routes.py"]
+    @pytest.mark.parametrize("config,files,scope,strategy,reason_sub", INFER_SCOPE_SCENARIOS)
+    def test_infer_scope_scenarios(self, config, files, scope, strategy, reason_sub):
+        """Test scope, strategy and reason for each scenario."""
         result = infer_scope(files, config)
 
-        assert result.scope is None
-        assert result.strategy_used == ScopeStrategy.NONE
+        assert result.scope == scope
+        assert result.strategy_used == strategy
+        if reason_sub is not None:
+            assert reason_sub in result.reason
 
 
 class TestLoadScopeConfigFromDict:
@@ -424,17 +439,15 @@ class TestScopeConfigToDict:
 class TestDefaultConstants:
     """Tests for default constants."""
 
-    def test_stop_words_contains_common(self):
+    @pytest.mark.parametrize("word", ["src", "lib", "tests", "node_modules"])
+    def test_stop_words_contains_common(self, word):
         """Test stop words contains common directories."""
-        assert "src" in DEFAULT_STOP_WORDS
-        assert "lib" in DEFAULT_STOP_WORDS
-        assert "tests" in DEFAULT_STOP_WORDS
-        assert "node_modules" in DEFAULT_STOP_WORDS
+        assert word in DEFAULT_STOP_WORDS
 
-    def test_monorepo_roots_contains_common(self):
+    @pytest.mark.parametrize("root", ["packages/", "apps/"])
+    def test_monorepo_roots_contains_common(self, root):
         """Test monorepo roots contains common patterns."""
-        assert "packages/" in DEFAULT_MONOREPO_ROOTS
-        assert "apps/" in DEFAULT_MONOREPO_ROOTS
+        assert root in DEFAULT_MONOREPO_ROOTS
 
 
 class TestScopeResult:
@@ -452,57 +465,3 @@ class TestScopeResult:
         assert result.scope == "api"
         assert result.confidence == 0.9
         assert result.strategy_used == ScopeStrategy.MAPPING
-
-
-class TestRealWorldScenarios:
-    """Tests for real-world repository scenarios."""
-
-    def test_django_project(self):
-        """Test scope inference for Django project structure."""
-        files = [
-            "myapp/api/views.py",
-            "myapp/api/serializers.py",
-            "myapp/api/urls.py",
-        ]
-        config = ScopeConfig(strategy=ScopeStrategy.PATH_PREFIX)
-        result = infer_scope(files, config)
-
-        assert result.scope == "api"
-
-    def test_react_project(self):
-        """Test scope inference for React project structure."""
-        files = [
-            "src/components/Button.jsx",
-            "src/components/Input.jsx",
-        ]
-        config = ScopeConfig(strategy=ScopeStrategy.PATH_PREFIX)
-        result = infer_scope(files, config)
-
-        assert result.scope == "components"
-
-    def test_nx_monorepo(self):
-        """Test scope inference for Nx monorepo."""
-        files = [
-            "libs/shared-ui/src/Button.tsx",
-            "libs/shared-ui/src/Input.tsx",
-        ]
-        config = ScopeConfig(
-            strategy=ScopeStrategy.MONOREPO,
-            monorepo_roots=["libs/", "apps/"],
-        )
-        result = infer_scope(files, config)
-
-        assert result.scope == "shared-ui"
-
-    def test_python_package(self):
-        """Test scope inference for Python package."""
-        files = [
-            "hunknote/cli.py",
-            "hunknote/config.py",
-            "hunknote/cache.py",
-        ]
-        config = ScopeConfig(strategy=ScopeStrategy.PATH_PREFIX)
-        result = infer_scope(files, config)
-
-        assert result.scope == "hunknote"
-